@@ -12,6 +12,7 @@ class TimeCalculator:
     """Calculates working hours and required logout time"""
     
     REQUIRED_HOURS = 8  # Minimum required hours in office
+    VERSION = 1  # Bump whenever results change, to invalidate cached results
     
     @staticmethod
     def calculate_logout_time(entries: List[LogEntry]) -> Dict:
@@ -2,7 +2,7 @@
 FastAPI Backend for Time Management Calculator
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional
@@ -10,6 +10,7 @@ import uvicorn
 
 from parser import LogParser
 from calculator import TimeCalculator
+from result_cache import ResultCache
 
 
 app = FastAPI(
@@ -25,8 +26,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Content-Location"],
 )
 
+# Completed employee-day results, addressed by a content hash of the logs
+result_cache = ResultCache()
+
 
 class LogRequest(BaseModel):
     """Request model for log calculation"""
@@ -58,6 +63,7 @@ async def root():
         "version": "1.0.0",
         "endpoints": {
             "POST /calculate": "Calculate logout time from logs",
+            "GET /results/{log_hash}": "Fetch a completed result by log hash",
             "GET /health": "Health check"
         }
     }
@@ -69,11 +75,70 @@ async def health_check():
     return {"status": "healthy"}
 
 
+def _set_cache_headers(response: Response, log_hash: str, result: dict):
+    """Attach ETag/Cache-Control headers depending on result immutability"""
+    if ResultCache.is_immutable(result):
+        response.headers["ETag"] = ResultCache.etag_for(log_hash)
+        response.headers["Cache-Control"] = ResultCache.CACHE_CONTROL_IMMUTABLE
+        response.headers["Content-Location"] = f"/results/{log_hash}"
+    else:
+        response.headers["Cache-Control"] = ResultCache.CACHE_CONTROL_NO_STORE
+
+
+def _not_modified(log_hash: str) -> Response:
+    """Build a 304 response for a cached result"""
+    return Response(
+        status_code=304,
+        headers={
+            "ETag": ResultCache.etag_for(log_hash),
+            "Cache-Control": ResultCache.CACHE_CONTROL_IMMUTABLE,
+        },
+    )
+
+
+@app.get("/results/{log_hash}", response_model=CalculationResponse)
+async def get_result(
+    log_hash: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Fetch a completed result by the SHA-256 hash of its logs
+    
+    Args:
+        log_hash: Hex SHA-256 of the trimmed logs
+        if_none_match: Optional If-None-Match header from the client
+        
+    Returns:
+        CalculationResponse, or 304 Not Modified if the ETag matches
+        
+    Raises:
+        HTTPException: If no completed result is cached for the hash
+    """
+    result = result_cache.get(log_hash)
+    if result is None:
+        # Never let a CDN hold on to the miss; the result may appear later
+        raise HTTPException(
+            status_code=404,
+            detail="No completed result for these logs. POST them to /calculate first.",
+            headers={"Cache-Control": ResultCache.CACHE_CONTROL_NO_STORE}
+        )
+    
+    if ResultCache.etag_matches(if_none_match, ResultCache.etag_for(log_hash)):
+        return _not_modified(log_hash)
+    
+    _set_cache_headers(response, log_hash, result)
+    return result
+
+
 @app.post("/calculate", response_model=CalculationResponse)
-async def calculate_logout(request: LogRequest):
+async def calculate_logout(request: LogRequest, response: Response):
     """
     Calculate logout time from time-management logs
     
+    Completed days are cached by log hash and never recomputed. Conditional
+    requests are only handled by GET /results/{log_hash}.
+    
     Args:
         request: LogRequest containing raw log entries
         
@@ -83,6 +148,12 @@ async def calculate_logout(request: LogRequest):
     Raises:
         HTTPException: If parsing or calculation fails
     """
+    log_hash = ResultCache.hash_logs(request.logs)
+    cached = result_cache.get(log_hash)
+    if cached is not None:
+        _set_cache_headers(response, log_hash, cached)
+        return cached
+    
     try:
         # Parse the logs
         entries = LogParser.parse_logs(request.logs)
@@ -110,6 +181,8 @@ async def calculate_logout(request: LogRequest):
         # Calculate logout time
         result = TimeCalculator.calculate_logout_time(employee_entries)
         
+        result_cache.put(log_hash, result)
+        _set_cache_headers(response, log_hash, result)
         return result
         
     except ValueError as e:
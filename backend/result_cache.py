@@ -0,0 +1,92 @@
+"""
+Result Cache
+Stores immutable calculation results addressed by a content hash of the logs
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional
+import hashlib
+
+from calculator import TimeCalculator
+
+
+class ResultCache:
+    """In-memory LRU cache of completed employee-day results"""
+
+    MAX_ENTRIES = 1024  # Oldest results are evicted beyond this size
+    # Results contain employee details, so only the requesting browser may cache them
+    CACHE_CONTROL_IMMUTABLE = "private, max-age=31536000, immutable"
+    CACHE_CONTROL_NO_STORE = "no-store"
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._results: "OrderedDict[str, Dict]" = OrderedDict()
+
+    @staticmethod
+    def hash_logs(raw_logs: str, version: Optional[int] = None) -> str:
+        """
+        Compute the content hash that addresses a set of logs
+
+        The hash covers the calculator version and the trimmed logs, matching
+        the SHA-256 of "v<version>\n<logs>" computed by the frontend, so a
+        version bump invalidates every cached result.
+        """
+        if version is None:
+            version = TimeCalculator.VERSION
+        content = f"v{version}\n{raw_logs.strip()}"
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def etag_for(log_hash: str) -> str:
+        """Build the strong ETag header value for a log hash"""
+        return f'"{log_hash}"'
+
+    @staticmethod
+    def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+        """Check whether an If-None-Match header value matches an ETag"""
+        if not if_none_match:
+            return False
+
+        for candidate in if_none_match.split(","):
+            candidate = candidate.strip()
+            if candidate == "*":
+                return True
+            # Weak comparison is sufficient for conditional GET
+            if candidate.startswith("W/"):
+                candidate = candidate[2:]
+            if candidate == etag:
+                return True
+        return False
+
+    @staticmethod
+    def is_immutable(result: Dict) -> bool:
+        """
+        A result is immutable once the day is completed with a last OUT,
+        since it no longer depends on the current time
+        """
+        return result.get("status") == "completed" and result.get("last_out") is not None
+
+    def get(self, log_hash: str) -> Optional[Dict]:
+        """Return a copy of the cached result for a log hash, if any"""
+        result = self._results.get(log_hash)
+        if result is None:
+            return None
+        self._results.move_to_end(log_hash)
+        return dict(result)
+
+    def put(self, log_hash: str, result: Dict) -> bool:
+        """
+        Cache a copy of a result if it is immutable
+
+        Returns:
+            True if the result was stored, False otherwise
+        """
+        if not self.is_immutable(result):
+            return False
+
+        # Store a copy so callers cannot mutate the cached entry
+        self._results[log_hash] = dict(result)
+        self._results.move_to_end(log_hash)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+        return True
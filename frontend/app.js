@@ -9,6 +9,12 @@ const CONFIG = {
     API_URL: 'https://time-project-3.onrender.com',
     // For production, use your deployed backend:
     // API_URL: 'https://your-backend.onrender.com'
+    // Must match TimeCalculator.VERSION in the backend
+    RESULT_VERSION: 1,
+    // localStorage key prefix for completed (immutable) results
+    RESULT_CACHE_PREFIX: 'result:',
+    // Only the most recently stored results are kept
+    RESULT_CACHE_MAX_ENTRIES: 30,
 };
 
 // Sample data for testing
@@ -70,12 +76,92 @@ function handleLoadSample() {
     showNotification('Sample data loaded', 'success');
 }
 
+// SHA-256 of the result version and logs, matching the backend's result hash
+async function hashLogs(logs) {
+    if (!window.crypto || !window.crypto.subtle) {
+        return null;
+    }
+    const data = new TextEncoder().encode(`v${CONFIG.RESULT_VERSION}\n${logs.trim()}`);
+    const digest = await window.crypto.subtle.digest('SHA-256', data);
+    return Array.from(new Uint8Array(digest))
+        .map(b => b.toString(16).padStart(2, '0'))
+        .join('');
+}
+
+// Look up a completed result stored from a previous calculation
+function getCachedResult(logHash) {
+    if (!logHash) return null;
+    try {
+        const cached = localStorage.getItem(CONFIG.RESULT_CACHE_PREFIX + logHash);
+        return cached ? JSON.parse(cached).result || null : null;
+    } catch (error) {
+        return null;
+    }
+}
+
+// Completed days with a last OUT never change, so keep them locally
+function storeCachedResult(logHash, result) {
+    if (!logHash || result.status !== 'completed' || !result.last_out) return;
+    try {
+        localStorage.setItem(
+            CONFIG.RESULT_CACHE_PREFIX + logHash,
+            JSON.stringify({ storedAt: Date.now(), result })
+        );
+        pruneCachedResults();
+    } catch (error) {
+        // Storage full or disabled - caching is best effort
+    }
+}
+
+// Drop the oldest stored results beyond RESULT_CACHE_MAX_ENTRIES
+function pruneCachedResults() {
+    const entries = [];
+    for (let i = 0; i < localStorage.length; i++) {
+        const key = localStorage.key(i);
+        if (!key || !key.startsWith(CONFIG.RESULT_CACHE_PREFIX)) continue;
+        let storedAt = 0;
+        try {
+            storedAt = JSON.parse(localStorage.getItem(key)).storedAt || 0;
+        } catch (error) {
+            // Unreadable entries sort first and are removed
+        }
+        entries.push({ key, storedAt });
+    }
+
+    entries
+        .sort((a, b) => b.storedAt - a.storedAt)
+        .slice(CONFIG.RESULT_CACHE_MAX_ENTRIES)
+        .forEach(entry => localStorage.removeItem(entry.key));
+}
+
+// Fetch a completed result computed earlier; null if the server has none
+async function fetchCompletedResult(logHash, signal) {
+    if (!logHash) return null;
+
+    // The browser's HTTP cache revalidates with If-None-Match as needed
+    const response = await fetch(`${CONFIG.API_URL}/results/${logHash}`, { signal });
+    return response.ok ? await response.json() : null;
+}
+
 // API call to calculate logout time with timeout and retry
 async function calculateLogoutTime(logs) {
+    const logHash = await hashLogs(logs);
+    const cached = getCachedResult(logHash);
+    if (cached) {
+        return cached;
+    }
+
     const controller = new AbortController();
     const timeoutId = setTimeout(() => controller.abort(), 90000); // 90 second timeout
 
     try {
+        const completed = await fetchCompletedResult(logHash, controller.signal);
+        if (completed) {
+            clearTimeout(timeoutId);
+            storeCachedResult(logHash, completed);
+            return completed;
+        }
+
         const response = await fetch(`${CONFIG.API_URL}/calculate`, {
             method: 'POST',
             headers: {
@@ -92,7 +178,9 @@ async function calculateLogoutTime(logs) {
             throw new Error(error.detail || 'Calculation failed');
         }
 
-        return await response.json();
+        const result = await response.json();
+        storeCachedResult(logHash, result);
+        return result;
     } catch (error) {
         clearTimeout(timeoutId);
 
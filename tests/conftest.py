@@ -0,0 +1,19 @@
+"""
+Shared fixtures for Time Management Calculator tests
+"""
+
+import pytest
+
+
+@pytest.fixture
+def completed_logs():
+    """Logs for a completed day with a last office OUT"""
+    return """104138	Test User	10-12-2025	10-12-2025 09:00:00	IN - 1	Entry Granted
+104138	Test User	10-12-2025	10-12-2025 18:00:00	OUT - 1	Exit Granted"""
+
+
+@pytest.fixture
+def in_progress_logs():
+    """Logs for a day still in progress"""
+    # A late IN keeps the day in progress whatever the current time of day
+    return """104138	Test User	10-12-2025	10-12-2025 23:59:59	IN - 1	Entry Granted"""
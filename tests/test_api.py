@@ -0,0 +1,105 @@
+"""
+API Tests for Time Management Calculator
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from calculator import TimeCalculator
+from result_cache import ResultCache
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Test client with an empty result cache"""
+    monkeypatch.setattr(main, "result_cache", ResultCache())
+    return TestClient(main.app)
+
+
+class TestCalculateEndpoint:
+    """Test cases for POST /calculate"""
+    
+    def test_completed_result_headers(self, client, completed_logs):
+        """Test caching headers on a completed day"""
+        log_hash = ResultCache.hash_logs(completed_logs)
+        response = client.post("/calculate", json={"logs": completed_logs})
+        
+        assert response.status_code == 200
+        assert response.json()["status"] == "completed"
+        assert response.headers["ETag"] == f'"{log_hash}"'
+        assert response.headers["Cache-Control"] == ResultCache.CACHE_CONTROL_IMMUTABLE
+        assert response.headers["Content-Location"] == f"/results/{log_hash}"
+    
+    def test_in_progress_result_not_stored(self, client, in_progress_logs):
+        """Test that in-progress results are sent with no-store"""
+        response = client.post("/calculate", json={"logs": in_progress_logs})
+        
+        assert response.status_code == 200
+        assert response.json()["status"] == "in_progress"
+        assert response.headers["Cache-Control"] == ResultCache.CACHE_CONTROL_NO_STORE
+        assert "ETag" not in response.headers
+    
+    def test_cache_hit_skips_recomputation(self, client, completed_logs, monkeypatch):
+        """Test that a completed day is not recalculated"""
+        first = client.post("/calculate", json={"logs": completed_logs})
+        
+        def fail(entries):
+            raise AssertionError("result was recomputed")
+        monkeypatch.setattr(TimeCalculator, "calculate_logout_time", staticmethod(fail))
+        
+        second = client.post("/calculate", json={"logs": completed_logs})
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        assert second.headers["ETag"] == first.headers["ETag"]
+    
+    def test_post_ignores_if_none_match(self, client, completed_logs):
+        """Test that a POST never answers 304"""
+        first = client.post("/calculate", json={"logs": completed_logs})
+        second = client.post(
+            "/calculate",
+            json={"logs": completed_logs},
+            headers={"If-None-Match": first.headers["ETag"]}
+        )
+        
+        assert second.status_code == 200
+        assert second.json() == first.json()
+
+
+class TestResultsEndpoint:
+    """Test cases for GET /results/{log_hash}"""
+    
+    def test_get_completed_result(self, client, completed_logs):
+        """Test fetching a completed result by hash"""
+        posted = client.post("/calculate", json={"logs": completed_logs})
+        log_hash = ResultCache.hash_logs(completed_logs)
+        response = client.get(f"/results/{log_hash}")
+        
+        assert response.status_code == 200
+        assert response.json() == posted.json()
+        assert response.headers["ETag"] == f'"{log_hash}"'
+        assert response.headers["Cache-Control"] == ResultCache.CACHE_CONTROL_IMMUTABLE
+    
+    def test_matching_etag_returns_304(self, client, completed_logs):
+        """Test conditional GET with a matching If-None-Match"""
+        client.post("/calculate", json={"logs": completed_logs})
+        log_hash = ResultCache.hash_logs(completed_logs)
+        response = client.get(
+            f"/results/{log_hash}",
+            headers={"If-None-Match": f'"{log_hash}"'}
+        )
+        
+        assert response.status_code == 304
+        assert response.headers["ETag"] == f'"{log_hash}"'
+        assert response.content == b""
+    
+    def test_unknown_hash_returns_404(self, client):
+        """Test that a miss is not cacheable"""
+        response = client.get("/results/" + "0" * 64)
+        
+        assert response.status_code == 404
+        assert response.headers["Cache-Control"] == ResultCache.CACHE_CONTROL_NO_STORE
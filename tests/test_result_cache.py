@@ -0,0 +1,84 @@
+"""
+Unit Tests for the Result Cache
+"""
+
+import sys
+import os
+import hashlib
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+from parser import LogParser
+from calculator import TimeCalculator
+from result_cache import ResultCache
+
+
+class TestResultCache:
+    """Test cases for ResultCache"""
+    
+    def test_hash_ignores_surrounding_whitespace(self, completed_logs, in_progress_logs):
+        """Test that the log hash is stable across trimming"""
+        assert ResultCache.hash_logs(completed_logs) == ResultCache.hash_logs("\n" + completed_logs + "  \n")
+        assert ResultCache.hash_logs(completed_logs) != ResultCache.hash_logs(in_progress_logs)
+    
+    def test_hash_includes_calculator_version(self, completed_logs):
+        """Test that the frontend-compatible hash covers the calculator version"""
+        expected = hashlib.sha256(
+            f"v{TimeCalculator.VERSION}\n{completed_logs}".encode("utf-8")
+        ).hexdigest()
+        assert ResultCache.hash_logs(completed_logs) == expected
+    
+    def test_version_change_changes_etag(self, completed_logs, monkeypatch):
+        """Test that bumping the calculator version invalidates the ETag"""
+        old_etag = ResultCache.etag_for(ResultCache.hash_logs(completed_logs))
+        monkeypatch.setattr(TimeCalculator, "VERSION", TimeCalculator.VERSION + 1)
+        new_etag = ResultCache.etag_for(ResultCache.hash_logs(completed_logs))
+        
+        assert new_etag != old_etag
+    
+    def test_completed_result_is_cached(self, completed_logs):
+        """Test that completed days with a last OUT are stored"""
+        result = TimeCalculator.calculate_logout_time(LogParser.parse_logs(completed_logs))
+        cache = ResultCache()
+        log_hash = ResultCache.hash_logs(completed_logs)
+        
+        assert result["status"] == "completed"
+        assert cache.put(log_hash, result)
+        assert cache.get(log_hash) == result
+    
+    def test_in_progress_result_is_not_cached(self):
+        """Test that in-progress results are never stored"""
+        cache = ResultCache()
+        result = {"status": "in_progress", "last_out": None}
+        
+        assert not cache.put("abc", result)
+        assert cache.get("abc") is None
+    
+    def test_cached_result_is_not_shared(self):
+        """Test that mutating a stored or returned result leaves the cache intact"""
+        cache = ResultCache()
+        result = {"status": "completed", "last_out": "2025-12-10T18:00:00"}
+        cache.put("abc", result)
+        
+        result["status"] = "changed"
+        cache.get("abc")["status"] = "changed"
+        assert cache.get("abc")["status"] == "completed"
+    
+    def test_eviction(self):
+        """Test that the oldest result is evicted beyond max_entries"""
+        cache = ResultCache(max_entries=2)
+        result = {"status": "completed", "last_out": "2025-12-10T18:00:00"}
+        for log_hash in ("a", "b", "c"):
+            cache.put(log_hash, result)
+        
+        assert cache.get("a") is None
+        assert cache.get("c") == result
+    
+    def test_etag_matching(self):
+        """Test If-None-Match comparison"""
+        etag = ResultCache.etag_for("abc")
+        assert etag == '"abc"'
+        assert ResultCache.etag_matches('"abc"', etag)
+        assert ResultCache.etag_matches('"xyz", W/"abc"', etag)
+        assert ResultCache.etag_matches("*", etag)
+        assert not ResultCache.etag_matches('"xyz"', etag)
+        assert not ResultCache.etag_matches(None, etag)